@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+Ponto de entrada da extração de PDF executada em processo separado.
+Módulo leve: PyPDF2, camelot e tabula só são importados dentro do processo
+auxiliar, nunca no processo da interface.
+"""
+
+
+def extrair_pdf(pdf_path: str) -> dict:
+    """
+    Extrai todos os dados do PDF e retorna o dicionário bruto.
+    Função de módulo (serializável via pickle) para rodar em processo separado.
+    """
+    from Extrator.PDFExtractor import PDFExtractor
+    
+    return PDFExtractor(pdf_path).to_dict()
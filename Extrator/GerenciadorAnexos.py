@@ -262,14 +262,6 @@ def obter_caminho_anexos_json() -> Path:
     Returns:
         Path para fornecedor_anexos.json
     """
-    import sys
-    from pathlib import Path
-    
-    # Adiciona raiz ao path se necessário
-    root_dir = Path(__file__).resolve().parents[1]
-    if str(root_dir) not in sys.path:
-        sys.path.insert(0, str(root_dir))
-    
     from utils import get_arquivos_dir
     
     return get_arquivos_dir() / "fornecedor_anexos.json"
\ No newline at end of file
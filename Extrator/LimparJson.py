@@ -7,6 +7,12 @@ import re
 import json
 from pathlib import Path
 
+# Padrões usados para cada linha da tabela
+_ESPACOS_MULTIPLOS = re.compile(r"\s{2,}")
+_EMAIL = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+_CODIGO_BANCO = re.compile(r'^(\d{3})')
+_ENDERECO = re.compile(r"(.+?)[,\s]+(\d+)(.*)")
+
 
 class PDFCompanyExtractor:
     """
@@ -48,7 +54,7 @@ class PDFCompanyExtractor:
         if not text:
             return ""
         text = str(text).replace("\n", " ")
-        text = re.sub(r"\s{2,}", " ", text)
+        text = _ESPACOS_MULTIPLOS.sub(" ", text)
         return text.strip()
 
     @staticmethod
@@ -60,7 +66,7 @@ class PDFCompanyExtractor:
     @staticmethod
     def extract_emails(text):
         """Extrai emails do texto usando regex"""
-        return re.findall(r"[\w\.-]+@[\w\.-]+\.\w+", text)
+        return _EMAIL.findall(text)
     
     @staticmethod
     def extract_codigo_banco(banco_text):
@@ -72,7 +78,7 @@ class PDFCompanyExtractor:
             return ""
         
         # Procura por padrão: 3 dígitos no início
-        match = re.match(r'^(\d{3})', str(banco_text).strip())
+        match = _CODIGO_BANCO.match(str(banco_text).strip())
         if match:
             return match.group(1)
         
@@ -94,11 +100,14 @@ class PDFCompanyExtractor:
 
         self.full_text = ""
         self.table_dict = {}
+        # Chaves da tabela já em minúsculas: (chave_minuscula, chave, valor)
+        self._linhas_tabela = []
 
     def _build_full_text(self):
         """Constrói texto completo de todas as páginas"""
-        for _, txt in self.pdf_json.get("text", {}).items():
-            self.full_text += "\n" + str(txt)
+        self.full_text = "".join(
+            "\n" + str(txt) for txt in self.pdf_json.get("text", {}).values()
+        )
 
     def _build_table_dict(self):
         """Constrói dicionário chave-valor a partir das tabelas"""
@@ -117,10 +126,14 @@ class PDFCompanyExtractor:
             if key:  # Ignora linhas vazias
                 self.table_dict[key] = val
 
+        self._linhas_tabela = [(k.lower(), k, v) for k, v in self.table_dict.items()]
+
     def _find_value(self, alias_list):
         """Busca valor na tabela usando lista de aliases"""
-        for k, v in self.table_dict.items():
-            if self.match_key(k, alias_list):
+        aliases = [alias.lower() for alias in alias_list]
+        
+        for k_lower, k, v in self._linhas_tabela:
+            if any(alias in k_lower for alias in aliases):
                 if v:
                     return v
 
@@ -182,7 +195,7 @@ class PDFCompanyExtractor:
 
         # Parse de endereço (rua, número, complemento)
         rua = numero = complemento = ""
-        m = re.match(r"(.+?)[,\s]+(\d+)(.*)", rua_completa)
+        m = _ENDERECO.match(rua_completa)
         if m:
             rua = self.normalize(m.group(1))
             numero = self.normalize(m.group(2))
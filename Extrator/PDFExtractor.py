@@ -3,16 +3,13 @@
 Módulo de extração de dados de arquivos PDF.
 Garante encoding UTF-8 correto em todas as operações.
 """
-import json
-import sys
 import PyPDF2
 import camelot
 import tabula
 from pathlib import Path
 
-# Adiciona o diretório raiz ao path
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-from utils import get_json_paths
+from _bootstrap import ROOT_DIR
+from utils import get_json_paths, json_dumps
 
 
 class PDFExtractor:
@@ -151,29 +148,26 @@ class PDFExtractor:
             "pages_total": self.num_pages
         }
 
+    def to_dict(self):
+        """Retorna os dados extraídos como dicionário (sem gravar em disco)"""
+        return self.extract_all()
+
     def save_to_json(self, output_path: Path = None):
         """
         Salva os dados extraídos em JSON com encoding UTF-8.
         Se output_path não for fornecido, salva em Arquivos/fornecedor_bruto.json
         """
         if output_path is None:
-            # Busca o diretório raiz do projeto (onde está main.py)
-            current = Path(__file__).resolve().parent
-            while current.parent != current:
-                if (current / "main.py").exists():
-                    break
-                current = current.parent
-            output_path = current / "Arquivos" / "fornecedor_bruto.json"
+            output_path = ROOT_DIR / "Arquivos" / "fornecedor_bruto.json"
         
         # Garante que o diretório existe
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        dados = self.extract_all()
+        dados = self.to_dict()
 
-        # Salva com encoding UTF-8 e ensure_ascii=False
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(dados, f, indent=4, ensure_ascii=False)
+        # Salva com encoding UTF-8 (orjson quando disponível)
+        output_path.write_bytes(json_dumps(dados))
 
         print(f"[INFO] Dados extraídos salvos com UTF-8 em: {output_path}")
 
-        return output_path
\ No newline at end of file
+        return output_path
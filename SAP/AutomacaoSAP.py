@@ -20,7 +20,6 @@ PORTABILIDADE:
 - Independente de ambiente/máquina
 """
 
-import sys
 import json
 from pathlib import Path
 from typing import Tuple, Dict
@@ -282,14 +281,12 @@ def executar_automacao() -> Tuple[bool, str]:
         (sucesso, mensagem)
     """
     try:
-        root_dir = Path(__file__).resolve().parents[1]
-        sys.path.insert(0, str(root_dir))
-        
+        from _bootstrap import ROOT_DIR
         from utils import get_json_paths
         
         paths = get_json_paths()
         dados_json = paths["limpo"]
-        campos_sap_json = root_dir / "SAP" / "campos_sap.json"
+        campos_sap_json = ROOT_DIR / "SAP" / "campos_sap.json"
         
         if not dados_json.exists():
             return False, f"Arquivo não encontrado:\n{dados_json}"
@@ -71,11 +71,6 @@ class GerenciadorAnexosSAP:
             Dicionário {nome: caminho} dos anexos
         """
         try:
-            import sys
-            root_dir = Path(__file__).resolve().parents[1]
-            if str(root_dir) not in sys.path:
-                sys.path.insert(0, str(root_dir))
-            
             from Extrator.GerenciadorAnexos import obter_caminho_anexos_json
             json_path = obter_caminho_anexos_json()
             
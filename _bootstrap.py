@@ -0,0 +1,12 @@
+"""
+Registro único da raiz do projeto no sys.path.
+Importado uma vez pelo main.py; os demais módulos apenas reutilizam ROOT_DIR.
+"""
+import sys
+from pathlib import Path
+
+# Raiz do projeto (onde está main.py)
+ROOT_DIR = Path(__file__).resolve().parent
+
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
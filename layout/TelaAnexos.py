@@ -2,7 +2,6 @@
 Tela para gerenciamento de anexos de arquivos do fornecedor.
 Valida anexos obrigatórios e permite anexos opcionais.
 """
-import sys
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -10,12 +9,11 @@ from PySide6.QtWidgets import (
     QFrame, QScrollArea, QFileDialog, QMessageBox, QLineEdit,
     QDialog, QDialogButtonBox
 )
-from PySide6.QtGui import QFont, QPalette, QColor, QPixmap
+from PySide6.QtGui import QFont
 from PySide6.QtCore import Qt
 
-# Adiciona raiz ao path
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 from Extrator.GerenciadorAnexos import GerenciadorAnexos, obter_caminho_anexos_json
+from layout.Tema import obter_paleta_clara, obter_logo
 
 
 class DialogoNomeAnexo(QDialog):
@@ -81,6 +79,9 @@ class TelaAnexos(QWidget):
         # MODIFICADO: limpar_ao_iniciar=True para sempre começar vazio
         self.gerenciador = GerenciadorAnexos(obter_caminho_anexos_json(), limpar_ao_iniciar=True)
         
+        # Último estado aplicado ao rodapé (texto, estilo, botão habilitado)
+        self._ultimo_status = (None, None, None)
+        
         self.setWindowTitle("Anexos do Fornecedor")
         self._ajustar_tamanho_janela()
         
@@ -181,22 +182,15 @@ class TelaAnexos(QWidget):
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(40, 15, 40, 15)
         
-        # Logo
+        # Logo fixa
         logo_label = QLabel()
-        logo_path = Path(__file__).parent / "img" / "logo.png"
+        pixmap = obter_logo()
         
-        if logo_path.exists():
-            pixmap = QPixmap(str(logo_path))
-            if not pixmap.isNull():
-                pixmap = pixmap.scaled(200, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                logo_label.setPixmap(pixmap)
-            else:
-                logo_label.setText("Logo")
-                logo_label.setStyleSheet("color: #00adef; font-size: 16px; font-weight: bold; background-color: transparent;")
+        if pixmap is not None:
+            logo_label.setPixmap(pixmap)
         else:
             logo_label.setText("Logo")
             logo_label.setStyleSheet("color: #00adef; font-size: 16px; font-weight: bold; background-color: transparent;")
-            print(f"[AVISO] Logo não encontrada em: {logo_path}")
         
         logo_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         header_layout.addWidget(logo_label)
@@ -588,22 +582,25 @@ class TelaAnexos(QWidget):
         obrig_ok, opcionais_count = self.gerenciador.contar_anexos()
         
         if valido:
-            self.btn_continuar.setEnabled(True)
-            
             if opcionais_count > 0:
-                self.status_label.setText(
-                    f"✅ {obrig_ok}/3 obrigatórios • {opcionais_count} opcional(is)"
-                )
+                texto = f"✅ {obrig_ok}/3 obrigatórios • {opcionais_count} opcional(is)"
             else:
-                self.status_label.setText(f"✅ Todos os anexos obrigatórios preenchidos")
+                texto = f"✅ Todos os anexos obrigatórios preenchidos"
             
-            self.status_label.setStyleSheet("color: #27ae60; font-weight: 500; background-color: transparent;")
+            estilo = "color: #27ae60; font-weight: 500; background-color: transparent;"
         else:
-            self.btn_continuar.setEnabled(False)
-            self.status_label.setText(
-                f"⚠️ {len(faltantes)} anexo(s) obrigatório(s) faltando"
-            )
-            self.status_label.setStyleSheet("color: #e74c3c; font-weight: 500; background-color: transparent;")
+            texto = f"⚠️ {len(faltantes)} anexo(s) obrigatório(s) faltando"
+            estilo = "color: #e74c3c; font-weight: 500; background-color: transparent;"
+        
+        # Evita setStyleSheet (e repaint) quando nada mudou
+        novo_status = (texto, estilo, valido)
+        if novo_status == self._ultimo_status:
+            return
+        
+        self.status_label.setText(texto)
+        self.status_label.setStyleSheet(estilo)
+        self.btn_continuar.setEnabled(valido)
+        self._ultimo_status = novo_status
     
     def _continuar_automacao(self):
         """Valida e continua para automação"""
@@ -631,12 +628,4 @@ class TelaAnexos(QWidget):
     
     def apply_light_theme(self):
         """Aplica tema claro"""
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor("#f5f7fa"))
-        palette.setColor(QPalette.Base, QColor("#ffffff"))
-        palette.setColor(QPalette.Text, QColor("#2c3e50"))
-        palette.setColor(QPalette.Button, QColor("#ffffff"))
-        palette.setColor(QPalette.ButtonText, QColor("#2c3e50"))
-        palette.setColor(QPalette.Highlight, QColor("#00adef"))
-        palette.setColor(QPalette.HighlightedText, QColor("#ffffff"))
-        self.setPalette(palette)
\ No newline at end of file
+        self.setPalette(obter_paleta_clara())
\ No newline at end of file
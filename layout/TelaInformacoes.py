@@ -1,25 +1,62 @@
 # -*- coding: utf-8 -*-
-import json
-import re
-import sys
+import os
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 from PySide6.QtWidgets import (
     QWidget, QLabel, QLineEdit, QVBoxLayout,
     QHBoxLayout, QScrollArea, QFrame, QSizePolicy, QPushButton, QMessageBox, QGridLayout
 )
-from PySide6.QtGui import QFont, QPalette, QColor, QPixmap
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QFontMetrics
+from PySide6.QtCore import Qt, QTimer, QSignalBlocker
 
-# Adiciona o diretório raiz ao path
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-from utils import get_json_paths
+from utils import get_json_paths, json_loads, json_dumps
 from validadores import (
-    aplicar_validador, aplicar_mascara_automatica,
+    aplicar_validador, aplicar_mascara_automatica, texto_do_campo, somente_digitos,
     EmailValidator, CNPJValidator
 )
 from Extrator.PadronizarDados import PadronizadorDados
 from layout.TelaAnexos import TelaAnexos
+from layout.Tema import obter_paleta_clara, obter_logo
+
+
+@lru_cache(maxsize=512)
+def _cnpj_ok(valor: str) -> bool:
+    """Verifica se o CNPJ tem 14 dígitos, com cache"""
+    return len(somente_digitos(valor)) == 14
+
+
+# Títulos das categorias e labels dos campos (somente leitura, criados uma vez)
+_TITULOS_CATEGORIA = MappingProxyType({
+    'empresa': 'Informações da Empresa',
+    'endereco': 'Endereço',
+    'contato': 'Contatos',
+    'bancario': 'Dados Bancários',
+    'geral': 'Informações Gerais'
+})
+
+# Fallback de formatar_label para chaves sem rótulo definido: "_" -> " "
+_TRANSLATE_UNDERSCORE = str.maketrans("_", " ")
+
+_LABELS_CAMPOS = MappingProxyType({
+    'razao_social': 'Razão Social',
+    'nome_fantasia': 'Nome Fantasia',
+    'cnpj': 'CNPJ',
+    'inscricao_estadual': 'Inscrição Estadual',
+    'inscricao_municipal': 'Inscrição Municipal',
+    'cep': 'CEP',
+    'celular': 'Celular Principal',
+    'celular_secundario': 'Celular Secundário',
+    'email_comercial': 'E-mail Comercial',
+    'email_fiscal': 'E-mail Fiscal',
+    'codigo_banco': 'Código do Banco',
+    'agencia': 'Agência',
+    'conta_corrente': 'Conta Corrente',
+    'prazo_pagamento': 'Prazo de Pagamento',
+    'modalidade_frete': 'Modalidade de Frete (CIF/FOB)'
+})
+
 
 class TelaInformacoes(QWidget):
     """
@@ -50,6 +87,86 @@ class TelaInformacoes(QWidget):
         'nome_fantasia': 'nome_fantasia',
     }
 
+    # Limites validados após carregar o JSON:
+    # (categoria, chave, nome exibido, limite, tipo, conta apenas dígitos)
+    LIMITES_CAMPOS = (
+        ('empresa', 'razao_social', 'Razão Social', 40, 'excede_limite', False),
+        ('empresa', 'nome_fantasia', 'Nome Fantasia', 20, 'excede_limite', False),
+        ('bancario', 'codigo_banco', 'Código do Banco', 3, 'excede_digitos', True),
+        ('bancario', 'agencia', 'Agência', 4, 'excede_digitos', True),
+    )
+
+    # Fontes e estilos compartilhados pelos campos (evita recriar por widget)
+    _FONTE_TITULO_CATEGORIA = QFont("Segoe UI", 16, QFont.Bold)
+    _FONTE_LABEL = QFont("Segoe UI", 10)
+    _FONTE_CAMPO = QFont("Segoe UI", 11)
+
+    # Medidas das seções de categoria (também estimam a altura dos placeholders)
+    _ESPACO_SECAO = 12
+    _MARGEM_VERTICAL_CARD = 25
+    _ESPACO_LINHAS_GRID = 20
+    _ESPACO_LABEL_CAMPO = 6
+    _ALTURA_CAMPO = 40
+
+    _ESTILO_TITULO_CATEGORIA = """
+        QLabel {
+            color: #2c3e50;
+            padding-left: 5px;
+            border: none;
+            background-color: transparent;
+        }
+    """
+
+    _ESTILO_CARD = """
+        QFrame {
+            background-color: white;
+            border-radius: 12px;
+            border: 1px solid #e1e8ed;
+        }
+    """
+
+    _ESTILO_LABEL = """
+        QLabel {
+            border: none;
+            background-color: transparent;
+            color: #555555;
+        }
+    """
+
+    _ESTILO_LABEL_OBRIGATORIO = """
+        QLabel {
+            border: none;
+            background-color: transparent;
+            color: #e74c3c;
+        }
+    """
+
+    # Stylesheet único do container: o estado de cada QLineEdit é escolhido
+    # pela propriedade dinâmica "estado", sem reparse por campo
+    _ESTILO_CONTAINER = """
+        QWidget {
+            background-color: #f5f7fa;
+        }
+        QLineEdit[estado="ok"] {
+            background-color: #ffffff;
+            border: 2px solid #dfe6e9;
+            border-radius: 8px;
+            padding: 10px 14px;
+            color: #2c3e50;
+        }
+        QLineEdit[estado="invalido"] {
+            background-color: #fff5f5;
+            border: 2px solid #e74c3c;
+            border-radius: 8px;
+            padding: 10px 14px;
+            color: #2c3e50;
+        }
+        QLineEdit:focus {
+            border: 2px solid #00adef;
+            background-color: #f0f9ff;
+        }
+    """
+
     def __init__(self, json_path: Path = None, callback_automacao=None):
         super().__init__()
 
@@ -61,12 +178,28 @@ class TelaInformacoes(QWidget):
         self.callback_automacao = callback_automacao
         self.campos_widgets = {}
 
+        # Salvamento com debounce: grava o JSON só após 300 ms sem edições
+        self._ultimo_hash_payload = None
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(self._flush_json)
+
         self.setWindowTitle("Informações do Fornecedor")
 
         # Ajusta tamanho baseado no monitor
         self._ajustar_tamanho_janela()
 
         self.data = self.load_json()
+
+        # Validação incremental: conjunto de campos obrigatórios com problema
+        self._ids_obrigatorios = frozenset(
+            f"{categoria}.{chave}"
+            for categoria, chaves in self.CAMPOS_OBRIGATORIOS.items()
+            for chave in chaves
+        )
+        self._recalcular_campos_invalidos()
+
         self.apply_light_theme()
         self._build_ui()
 
@@ -115,6 +248,9 @@ class TelaInformacoes(QWidget):
 
     def _build_ui(self):
         """Constrói interface principal"""
+        # Suspende repaints enquanto os widgets são criados em lote
+        self.setUpdatesEnabled(False)
+
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
@@ -125,7 +261,7 @@ class TelaInformacoes(QWidget):
 
         # Container com fundo
         container = QWidget()
-        container.setStyleSheet("background-color: #f5f7fa;")
+        container.setStyleSheet(self._ESTILO_CONTAINER)
 
         scroll = QScrollArea()
         scroll.setWidget(container)
@@ -163,9 +299,29 @@ class TelaInformacoes(QWidget):
         self.scroll_layout.addWidget(subtitulo_secao)
 
         # Campos por categoria (sem cards nos títulos)
+        # Só a primeira categoria é construída agora; as demais entram como
+        # placeholders e são criadas quando se aproximam da área visível
+        self._scroll = scroll
+        self._secoes_pendentes = []
+        self._layout_pronto = False
+        primeira_secao = True
+        container.setUpdatesEnabled(False)
         for categoria, campos in self.data.items():
-            if isinstance(campos, dict):
+            if not isinstance(campos, dict):
+                continue
+
+            if primeira_secao:
                 self.scroll_layout.addWidget(self.criar_secao_categoria(categoria, campos))
+                primeira_secao = False
+            else:
+                placeholder = QWidget()
+                placeholder.setMinimumHeight(self._altura_estimada_secao(categoria, campos))
+                self.scroll_layout.addWidget(placeholder)
+                self._secoes_pendentes.append((placeholder, categoria))
+        container.setUpdatesEnabled(True)
+
+        scroll.verticalScrollBar().valueChanged.connect(self._materializar_secoes_visiveis)
+        scroll.verticalScrollBar().rangeChanged.connect(self._materializar_secoes_visiveis)
 
         self.scroll_layout.addStretch()
         main_layout.addWidget(scroll)
@@ -173,6 +329,61 @@ class TelaInformacoes(QWidget):
         # Rodapé com botões
         self._criar_rodape(main_layout)
 
+        self.setUpdatesEnabled(True)
+
+    def _altura_estimada_secao(self, categoria, campos):
+        """Estima a altura de uma seção já construída (para o placeholder)"""
+        chaves = set(campos) | set(self._get_empty_structure().get(categoria, {}))
+        linhas = (len(chaves) + 1) // 2
+
+        # Título + card (margens) + linhas de campo (label + input + espaçamento)
+        altura_titulo = QFontMetrics(self._FONTE_TITULO_CATEGORIA).height()
+        altura_linha = (
+            QFontMetrics(self._FONTE_LABEL).height()
+            + self._ESPACO_LABEL_CAMPO + self._ALTURA_CAMPO
+        )
+        return (
+            altura_titulo + self._ESPACO_SECAO
+            + 2 * self._MARGEM_VERTICAL_CARD
+            + linhas * altura_linha + max(linhas - 1, 0) * self._ESPACO_LINHAS_GRID
+        )
+
+    def _materializar_secoes_visiveis(self, *_):
+        """Constrói as seções pendentes que estão até uma tela abaixo da área visível"""
+        # rangeChanged dispara já durante o _build_ui, antes de os placeholders
+        # terem posição: só prossegue depois que a janela foi exibida
+        if not self._secoes_pendentes or not self._layout_pronto:
+            return
+
+        topo = self._scroll.verticalScrollBar().value()
+        limite = topo + 2 * self._scroll.viewport().height()
+
+        for pendente in list(self._secoes_pendentes):
+            placeholder, categoria = pendente
+            if placeholder.y() > limite:
+                continue
+
+            # Usa self.data atual (pode ter sido recarregado após padronização)
+            secao = self.criar_secao_categoria(categoria, self.data.get(categoria, {}))
+            indice = self.scroll_layout.indexOf(placeholder)
+            self.scroll_layout.insertWidget(indice, secao)
+            self.scroll_layout.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self._secoes_pendentes.remove(pendente)
+
+    def showEvent(self, event):
+        """Constrói as seções visíveis assim que a janela tem geometria"""
+        super().showEvent(event)
+        self._layout_pronto = True
+        QTimer.singleShot(0, self._materializar_secoes_visiveis)
+
+    def resizeEvent(self, event):
+        """Janela maior pode trazer novas seções para a área visível"""
+        super().resizeEvent(event)
+        if self.isVisible():
+            self._layout_pronto = True
+            QTimer.singleShot(0, self._materializar_secoes_visiveis)
+
     def _criar_header(self):
         """Cria header com logo fixa"""
         header = QFrame()
@@ -189,24 +400,10 @@ class TelaInformacoes(QWidget):
 
         # Logo fixa
         logo_label = QLabel()
-        logo_path = Path(__file__).parent / "img" / "logo.png"
+        pixmap = obter_logo()
 
-        if logo_path.exists():
-            pixmap = QPixmap(str(logo_path))
-            if not pixmap.isNull():
-                pixmap = pixmap.scaled(200, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                logo_label.setPixmap(pixmap)
-            else:
-                logo_label.setText("Logo")
-                logo_label.setStyleSheet("""
-                    QLabel {
-                        color: #00adef;
-                        font-size: 16px;
-                        font-weight: bold;
-                        border: none;
-                        background-color: transparent;
-                    }
-                """)
+        if pixmap is not None:
+            logo_label.setPixmap(pixmap)
         else:
             logo_label.setText("Logo")
             logo_label.setStyleSheet("""
@@ -218,7 +415,6 @@ class TelaInformacoes(QWidget):
                     background-color: transparent;
                 }
             """)
-            print(f"[AVISO] Logo não encontrada em: {logo_path}")
 
         logo_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         header_layout.addWidget(logo_label)
@@ -312,12 +508,14 @@ class TelaInformacoes(QWidget):
 
     def load_json(self):
         """Carrega dados do JSON"""
+        # Arquivo pode ter sido alterado por fora (ex: padronização)
+        self._ultimo_hash_payload = None
+
         if not self.json_path.exists():
             return self._get_empty_structure()
 
         try:
-            with open(self.json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_loads(self.json_path.read_bytes())
             return self._validate_structure(data)
         except Exception as e:
             print(f"Erro ao carregar JSON: {e}")
@@ -377,51 +575,18 @@ class TelaInformacoes(QWidget):
         """
         problemas = []
 
-        # Validar Razão Social (máx 40 caracteres)
-        razao = self.data.get('empresa', {}).get('razao_social', '')
-        if len(razao) > 40:
-            problemas.append({
-                'campo': 'Razão Social',
-                'valor_atual': razao,
-                'tamanho_atual': len(razao),
-                'limite': 40,
-                'tipo': 'excede_limite'
-            })
-
-        # Validar Nome Fantasia (máx 20 caracteres)
-        fantasia = self.data.get('empresa', {}).get('nome_fantasia', '')
-        if len(fantasia) > 20:
-            problemas.append({
-                'campo': 'Nome Fantasia',
-                'valor_atual': fantasia,
-                'tamanho_atual': len(fantasia),
-                'limite': 20,
-                'tipo': 'excede_limite'
-            })
-
-        # Validar Código do Banco (máx 3 dígitos)
-        codigo_banco = self.data.get('bancario', {}).get('codigo_banco', '')
-        numeros_banco = re.sub(r'\D', '', str(codigo_banco))
-        if len(numeros_banco) > 3:
-            problemas.append({
-                'campo': 'Código do Banco',
-                'valor_atual': codigo_banco,
-                'tamanho_atual': len(numeros_banco),
-                'limite': 3,
-                'tipo': 'excede_digitos'
-            })
-
-        # Validar Agência (máx 4 dígitos)
-        agencia = self.data.get('bancario', {}).get('agencia', '')
-        numeros_agencia = re.sub(r'\D', '', str(agencia))
-        if len(numeros_agencia) > 4:
-            problemas.append({
-                'campo': 'Agência',
-                'valor_atual': agencia,
-                'tamanho_atual': len(numeros_agencia),
-                'limite': 4,
-                'tipo': 'excede_digitos'
-            })
+        for categoria, chave, nome_campo, limite, tipo, apenas_digitos in self.LIMITES_CAMPOS:
+            valor = self.data.get(categoria, {}).get(chave, '')
+            medido = somente_digitos(str(valor)) if apenas_digitos else valor
+
+            if len(medido) > limite:
+                problemas.append({
+                    'campo': nome_campo,
+                    'valor_atual': valor,
+                    'tamanho_atual': len(medido),
+                    'limite': limite,
+                    'tipo': tipo
+                })
 
         return problemas
 
@@ -430,23 +595,24 @@ class TelaInformacoes(QWidget):
         if not problemas:
             return
 
-        mensagem = "⚠️ ATENÇàO: O extrator de PDF gerou dados que excedem os limites permitidos:\n\n"
-        mensagem += "Os seguintes campos precisam ser CORRIGIDOS manualmente:\n\n"
+        partes = [
+            "⚠️ ATENÇàO: O extrator de PDF gerou dados que excedem os limites permitidos:",
+            "",
+            "Os seguintes campos precisam ser CORRIGIDOS manualmente:",
+            "",
+        ]
 
         for p in problemas:
-            if p['tipo'] == 'excede_limite':
-                mensagem += f"• {p['campo']}:\n"
-                mensagem += f"  Atual: {p['tamanho_atual']} caracteres\n"
-                mensagem += f"  Limite: {p['limite']} caracteres\n"
-                mensagem += f"  Excesso: {p['tamanho_atual'] - p['limite']} caracteres\n\n"
-            else:  # excede_digitos
-                mensagem += f"• {p['campo']}:\n"
-                mensagem += f"  Atual: {p['tamanho_atual']} dígitos\n"
-                mensagem += f"  Limite: {p['limite']} dígitos\n"
-                mensagem += f"  Excesso: {p['tamanho_atual'] - p['limite']} dígitos\n\n"
-
-        mensagem += "❌ Os campos marcados em VERMELHO devem ser corrigidos antes de prosseguir.\n"
-        mensagem += "Você pode editar diretamente nos campos abaixo."
+            unidade = "caracteres" if p['tipo'] == 'excede_limite' else "dígitos"
+            partes.append(f"• {p['campo']}:")
+            partes.append(f"  Atual: {p['tamanho_atual']} {unidade}")
+            partes.append(f"  Limite: {p['limite']} {unidade}")
+            partes.append(f"  Excesso: {p['tamanho_atual'] - p['limite']} {unidade}")
+            partes.append("")
+
+        partes.append("❌ Os campos marcados em VERMELHO devem ser corrigidos antes de prosseguir.")
+        partes.append("Você pode editar diretamente nos campos abaixo.")
+        mensagem = "\n".join(partes)
 
         QMessageBox.warning(
             self,
@@ -454,46 +620,65 @@ class TelaInformacoes(QWidget):
             mensagem
         )
     def save_json(self):
-        """Salva dados no JSON"""
+        """Salva dados no JSON (ignora se o conteúdo não mudou)"""
         try:
+            payload = json_dumps(self.data)
+            payload_hash = hash(payload)
+            if payload_hash == self._ultimo_hash_payload:
+                return
+
             self.json_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.json_path, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=4)
+
+            # Grava em arquivo temporário e troca de forma atômica,
+            # evitando JSON truncado se o processo cair no meio da escrita
+            tmp_path = self.json_path.with_suffix(self.json_path.suffix + ".tmp")
+            substituido = False
+            try:
+                tmp_path.write_bytes(payload)
+                # No Windows falha com PermissionError enquanto outro processo
+                # mantém o JSON aberto; o próximo salvamento tenta de novo
+                os.replace(tmp_path, self.json_path)
+                substituido = True
+            except OSError as e:
+                print(f"[AVISO] Não foi possível salvar o JSON em {self.json_path}: {e}")
+                return
+            finally:
+                if not substituido:
+                    tmp_path.unlink(missing_ok=True)
+
+            self._ultimo_hash_payload = payload_hash
         except Exception as e:
             print(f"Erro ao salvar JSON: {e}")
 
+    def _flush_json(self):
+        """Grava imediatamente alterações pendentes do debounce"""
+        self._save_timer.stop()
+        self.save_json()
+
+    def closeEvent(self, event):
+        """Garante que edições pendentes sejam salvas ao fechar"""
+        self._flush_json()
+        super().closeEvent(event)
+
     def criar_secao_categoria(self, nome_categoria, campos):
         """Cria seção com título simples e campos em card"""
         secao = QWidget()
         secao_layout = QVBoxLayout(secao)
         secao_layout.setContentsMargins(0, 0, 0, 0)
-        secao_layout.setSpacing(12)
+        secao_layout.setSpacing(self._ESPACO_SECAO)
 
         # Título da categoria - SEM CARD, apenas texto
         titulo = QLabel(self._formatar_titulo_categoria(nome_categoria))
-        titulo.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        titulo.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                padding-left: 5px;
-                border: none;
-                background-color: transparent;
-            }
-        """)
+        titulo.setFont(self._FONTE_TITULO_CATEGORIA)
+        titulo.setStyleSheet(self._ESTILO_TITULO_CATEGORIA)
         secao_layout.addWidget(titulo)
 
         # Card com os campos
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 12px;
-                border: 1px solid #e1e8ed;
-            }
-        """)
+        card.setStyleSheet(self._ESTILO_CARD)
 
         card_layout = QVBoxLayout(card)
-        card_layout.setContentsMargins(30, 25, 30, 25)
+        card_layout.setContentsMargins(30, self._MARGEM_VERTICAL_CARD, 30, self._MARGEM_VERTICAL_CARD)
         card_layout.setSpacing(15)
 
         # Garante todos os campos da estrutura padrão
@@ -506,7 +691,7 @@ class TelaInformacoes(QWidget):
 
         # Grid com 2 colunas
         grid_layout = QGridLayout()
-        grid_layout.setSpacing(20)
+        grid_layout.setSpacing(self._ESPACO_LINHAS_GRID)
         grid_layout.setHorizontalSpacing(30)
         grid_layout.setColumnStretch(0, 1)
         grid_layout.setColumnStretch(1, 1)
@@ -531,7 +716,7 @@ class TelaInformacoes(QWidget):
     def criar_linha_campo(self, categoria, chave, valor):
         """Cria campo com label simples acima"""
         container = QVBoxLayout()
-        container.setSpacing(6)
+        container.setSpacing(self._ESPACO_LABEL_CAMPO)
 
         e_obrigatorio = self.is_campo_obrigatorio(categoria, chave)
 
@@ -541,21 +726,15 @@ class TelaInformacoes(QWidget):
             label_texto += " *"
 
         label = QLabel(label_texto)
-        label.setFont(QFont("Segoe UI", 10))
-        label.setStyleSheet(f"""
-            QLabel {{
-                border: none;
-                background-color: transparent;
-                color: {'#e74c3c' if e_obrigatorio else '#555555'};
-            }}
-        """)
+        label.setFont(self._FONTE_LABEL)
+        label.setStyleSheet(self._ESTILO_LABEL_OBRIGATORIO if e_obrigatorio else self._ESTILO_LABEL)
         container.addWidget(label)
 
         # Campo de entrada - COM borda
         campo = QLineEdit()
         campo.setText(str(valor) if valor else "")
-        campo.setFont(QFont("Segoe UI", 11))
-        campo.setMinimumHeight(40)
+        campo.setFont(self._FONTE_CAMPO)
+        campo.setMinimumHeight(self._ALTURA_CAMPO)
 
         # Aplica validadores
         tipo_campo = self.TIPOS_CAMPO.get(chave)
@@ -566,8 +745,9 @@ class TelaInformacoes(QWidget):
 
         self._atualizar_estilo_campo(campo, categoria, chave)
 
-        def on_text_changed(novo_valor):
-            self.atualizar_json(categoria, chave, novo_valor)
+        def on_text_changed(_novo_valor):
+            # Lido do campo para não gravar só os separadores da máscara
+            self.atualizar_json(categoria, chave, texto_do_campo(campo))
             self._atualizar_estilo_campo(campo, categoria, chave)
 
         campo.textChanged.connect(on_text_changed)
@@ -581,55 +761,38 @@ class TelaInformacoes(QWidget):
 
     def _atualizar_estilo_campo(self, campo, categoria, chave):
         """Atualiza estilo do campo baseado em validação"""
-        e_obrigatorio = self.is_campo_obrigatorio(categoria, chave)
-        valor = campo.text().strip()
-
-        campo_vazio = not valor
-        campo_invalido = False
-
-        if valor and e_obrigatorio:
-            tipo_campo = self.TIPOS_CAMPO.get(chave)
-            if tipo_campo == 'email':
-                campo_invalido = not EmailValidator.is_valid(valor)
-            elif tipo_campo == 'cnpj':
-                import re
-                numeros = re.sub(r'\D', '', valor)
-                campo_invalido = len(numeros) != 14
-
-        # Define cor da borda
-        if e_obrigatorio and (campo_vazio or campo_invalido):
-            border_color = "#e74c3c"
-            bg_color = "#fff5f5"
-        else:
-            border_color = "#dfe6e9"
-            bg_color = "#ffffff"
-
-        campo.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {bg_color};
-                border: 2px solid {border_color};
-                border-radius: 8px;
-                padding: 10px 14px;
-                color: #2c3e50;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid #00adef;
-                background-color: #f0f9ff;
-            }}
-        """)
+        invalido = (
+            self.is_campo_obrigatorio(categoria, chave)
+            and self._campo_invalido(chave, texto_do_campo(campo))
+        )
+
+        # Só reaplica o stylesheet quando o estado visual muda
+        novo_estado = "invalido" if invalido else "ok"
+        if campo.property("estado") == novo_estado:
+            return
+
+        campo.setProperty("estado", novo_estado)
+        campo.style().unpolish(campo)
+        campo.style().polish(campo)
 
     def atualizar_json(self, categoria, chave, novo_valor):
         """Atualiza JSON"""
+        # textChanged também dispara em reentradas (ex: máscara) sem mudança real
+        valor_atual = self.data.get(categoria, {}).get(chave)
+        if valor_atual is not None and str(valor_atual) == str(novo_valor):
+            return
+
         if categoria not in self.data:
             self.data[categoria] = {}
 
         self.data[categoria][chave] = novo_valor
-        self.save_json()
+        self._save_timer.start()
+        self._revalidar_campo(categoria, chave, novo_valor)
         self.atualizar_botao_automacao()
 
     def is_campo_obrigatorio(self, categoria, chave):
         """Verifica se campo é obrigatório"""
-        return categoria in self.CAMPOS_OBRIGATORIOS and chave in self.CAMPOS_OBRIGATORIOS[categoria]
+        return f"{categoria}.{chave}" in self._ids_obrigatorios
 
     def validar_dados_completo(self):
         """Valida todos os campos"""
@@ -666,21 +829,50 @@ class TelaInformacoes(QWidget):
                 tipo_campo = self.TIPOS_CAMPO.get(campo)
                 if tipo_campo == 'email' and not EmailValidator.is_valid(valor):
                     campos_faltantes.append(f"{self.formatar_label(campo)} - E-mail inválido")
-                elif tipo_campo == 'cnpj':
-                    import re
-                    numeros = re.sub(r'\D', '', valor)
-                    if len(numeros) != 14:
-                        campos_faltantes.append(f"{self.formatar_label(campo)} - CNPJ incompleto")
+                elif tipo_campo == 'cnpj' and not _cnpj_ok(valor):
+                    campos_faltantes.append(f"{self.formatar_label(campo)} - CNPJ incompleto")
 
         return campos_faltantes
 
+    def _campo_invalido(self, chave, valor):
+        """Verifica se o valor de um campo obrigatório está vazio ou inválido"""
+        valor = str(valor or '').strip()
+        if not valor:
+            return True
+
+        tipo_campo = self.TIPOS_CAMPO.get(chave)
+        if tipo_campo == 'email':
+            return not EmailValidator.is_valid(valor)
+        if tipo_campo == 'cnpj':
+            return not _cnpj_ok(valor)
+        return False
+
+    def _revalidar_campo(self, categoria, chave, valor):
+        """Atualiza apenas o campo alterado no conjunto de inválidos"""
+        campo_id = f"{categoria}.{chave}"
+        if campo_id not in self._ids_obrigatorios:
+            return
+
+        if self._campo_invalido(chave, valor):
+            self._campos_invalidos.add(campo_id)
+        else:
+            self._campos_invalidos.discard(campo_id)
+
+    def _recalcular_campos_invalidos(self):
+        """Refaz a validação completa (carga inicial ou recarga do JSON)"""
+        self._campos_invalidos = set()
+        for campo_id in self._ids_obrigatorios:
+            categoria, chave = campo_id.split('.')
+            valor = self.data.get(categoria, {}).get(chave, '')
+            self._revalidar_campo(categoria, chave, valor)
+
     def atualizar_botao_automacao(self):
         """Atualiza estado do botào"""
-        campos_faltantes = self.get_campos_faltantes()
+        total_invalidos = len(self._campos_invalidos)
 
-        if campos_faltantes:
+        if total_invalidos:
             self.btn_automacao.setEnabled(False)
-            self.status_label.setText(f" {len(campos_faltantes)} campo(s) precisam de atençãoo")
+            self.status_label.setText(f" {total_invalidos} campo(s) precisam de atençãoo")
             self.status_label.setStyleSheet("""
                 QLabel {
                     color: #e74c3c;
@@ -703,6 +895,9 @@ class TelaInformacoes(QWidget):
 
     def iniciar_automacao_sap(self):
         """Inicia automação SAP com padronizaçãoo prévia e anexos"""
+        # Padronizador lê o JSON do disco: grava edições pendentes antes
+        self._flush_json()
+
         campos_faltantes = self.get_campos_faltantes()
 
         if campos_faltantes:
@@ -810,54 +1005,42 @@ class TelaInformacoes(QWidget):
 
     def _atualizar_campos_na_tela(self):
         """Atualiza os campos na tela com os dados padronizados"""
+        # Sinais bloqueados: evita um atualizar_json/validação por campo
+        alterados = []
         for campo_id, widget in self.campos_widgets.items():
             categoria, chave = campo_id.split('.')
 
             if categoria in self.data and chave in self.data[categoria]:
                 novo_valor = self.data[categoria][chave]
-                widget.setText(str(novo_valor) if novo_valor else "")
+                novo_texto = str(novo_valor) if novo_valor else ""
+                if texto_do_campo(widget) == novo_texto:
+                    continue
+
+                # QSignalBlocker reativa os sinais mesmo se setText lançar exceção
+                with QSignalBlocker(widget):
+                    widget.setText(novo_texto)
+                alterados.append((widget, categoria, chave))
+
+        for widget, categoria, chave in alterados:
+            self._atualizar_estilo_campo(widget, categoria, chave)
+
+        self._recalcular_campos_invalidos()
+        self.save_json()
+        self.atualizar_botao_automacao()
 
     def _formatar_titulo_categoria(self, categoria):
         """Formata título da categoria"""
-        titulos = {
-            'empresa': 'Informações da Empresa',
-            'endereco': 'Endereço',
-            'contato': 'Contatos',
-            'bancario': 'Dados Bancários',
-            'geral': 'Informações Gerais'
-        }
-        return titulos.get(categoria, categoria.capitalize())
+        return _TITULOS_CATEGORIA.get(categoria, categoria.capitalize())
 
     @staticmethod
     def formatar_label(texto):
         """Formata label do campo"""
-        formatacao = {
-            'razao_social': 'Razão Social',
-            'nome_fantasia': 'Nome Fantasia',
-            'cnpj': 'CNPJ',
-            'inscricao_estadual': 'Inscrição Estadual',
-            'inscricao_municipal': 'Inscrição Municipal',
-            'cep': 'CEP',
-            'celular': 'Celular Principal',
-            'celular_secundario': 'Celular Secundário',
-            'email_comercial': 'E-mail Comercial',
-            'email_fiscal': 'E-mail Fiscal',
-            'codigo_banco': 'Código do Banco',
-            'agencia': 'Agência',
-            'conta_corrente': 'Conta Corrente',
-            'prazo_pagamento': 'Prazo de Pagamento',
-            'modalidade_frete': 'Modalidade de Frete (CIF/FOB)'
-        }
-        return formatacao.get(texto, texto.replace("_", " ").capitalize())
+        rotulo = _LABELS_CAMPOS.get(texto)
+        if rotulo is None:
+            # Só monta o rótulo genérico quando a chave não está no mapa
+            rotulo = texto.translate(_TRANSLATE_UNDERSCORE).capitalize()
+        return rotulo
 
     def apply_light_theme(self):
         """Aplica tema claro"""
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor("#f5f7fa"))
-        palette.setColor(QPalette.Base, QColor("#ffffff"))
-        palette.setColor(QPalette.Text, QColor("#2c3e50"))
-        palette.setColor(QPalette.Button, QColor("#ffffff"))
-        palette.setColor(QPalette.ButtonText, QColor("#2c3e50"))
-        palette.setColor(QPalette.Highlight, QColor("#00adef"))
-        palette.setColor(QPalette.HighlightedText, QColor("#ffffff"))
-        self.setPalette(palette)
\ No newline at end of file
+        self.setPalette(obter_paleta_clara())
\ No newline at end of file
@@ -1,23 +1,121 @@
-import sys
-import json
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, 
-    QFileDialog, QMessageBox, QProgressBar, QHBoxLayout, QFrame
+    QFileDialog, QMessageBox, QHBoxLayout, QFrame
 )
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QDragEnterEvent, QDropEvent, QPalette, QColor, QFont, QPixmap
-
-# Adiciona o diretório raiz ao path
-ROOT_DIR = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT_DIR))
+from PySide6.QtCore import Qt, QThread, QThreadPool, QRunnable, QTimer, Signal
+from PySide6.QtGui import QDragEnterEvent, QDropEvent, QFont
 
 # Imports das classes do projeto
-from Extrator.PDFExtractor import PDFExtractor
-from Extrator.LimparJson import PDFCompanyExtractor
-from layout.TelaInformacoes import TelaInformacoes
-from utils import get_json_paths
+# (as bibliotecas de PDF só são carregadas no processo de extração;
+# PDFCompanyExtractor e TelaInformacoes são importados sob demanda)
+from utils import get_json_paths, json_dumps
+from layout.Tema import obter_paleta_clara, obter_logo
+
+# Stylesheets da tela inicial: strings únicas reaproveitadas em todas as
+# chamadas (inclusive nos eventos de drag, disparados a cada movimento)
+_ESTILO_HEADER = """
+    QFrame {
+        background-color: white;
+        border-bottom: 1px solid #e1e8ed;
+    }
+"""
+
+# Card de drop: regras dos dois estados em um só stylesheet; os eventos
+# de drag apenas trocam a propriedade dinâmica "hover" e repolem o card
+_ESTILO_DROP_CARD = """
+    QFrame#dropCard {
+        background-color: white;
+        border-radius: 16px;
+        border: 3px dashed #bdc3c7;
+    }
+    QFrame#dropCard[hover="true"] {
+        background-color: #f0f9ff;
+        border: 3px dashed #00adef;
+    }
+    QLabel#dropTexto {
+        color: #95a5a6;
+        border: none;
+    }
+    QLabel#dropTexto[hover="true"] {
+        color: #00adef;
+    }
+"""
+
+# Indicador de atividade: um QLabel com poucos quadros trocados por timer,
+# no lugar de um QProgressBar indeterminado (que repinta continuamente)
+_ESTILO_SPINNER = "color: #00adef; border: none;"
+_QUADROS_SPINNER = ("●○○", "○●○", "○○●")
+_INTERVALO_SPINNER_MS = 300
+
+_ESTILO_BOTAO_PRINCIPAL = """
+    QPushButton {
+        background-color: #00adef;
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 15px 30px;
+    }
+    QPushButton:hover {
+        background-color: #0099d6;
+    }
+    QPushButton:pressed {
+        background-color: #0088bd;
+    }
+    QPushButton:disabled {
+        background-color: #bdc3c7;
+        color: #ecf0f1;
+    }
+"""
+
+_ESTILO_BOTAO_SECUNDARIO = """
+    QPushButton {
+        background-color: white;
+        color: #2c3e50;
+        border: 2px solid #00adef;
+        border-radius: 10px;
+        padding: 12px 25px;
+    }
+    QPushButton:hover {
+        background-color: #f0f9ff;
+        border-color: #0099d6;
+    }
+    QPushButton:pressed {
+        background-color: #e0f2ff;
+    }
+"""
+
+# Processo auxiliar para a extração do PDF (reaproveitado entre arquivos)
+_EXECUTOR_EXTRACAO: Optional[ProcessPoolExecutor] = None
+
+
+def _obter_executor_extracao() -> ProcessPoolExecutor:
+    """Cria o executor de extração na primeira chamada; depois reutiliza"""
+    global _EXECUTOR_EXTRACAO
+    
+    if _EXECUTOR_EXTRACAO is None:
+        _EXECUTOR_EXTRACAO = ProcessPoolExecutor(max_workers=1)
+    return _EXECUTOR_EXTRACAO
+
+
+class SalvarJsonBrutoTask(QRunnable):
+    """Grava o JSON bruto em segundo plano (arquivo usado apenas para depuração)"""
+    
+    def __init__(self, output_path: Path, dados: dict):
+        super().__init__()
+        self.output_path = output_path
+        self.dados = dados
+    
+    def run(self):
+        try:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            self.output_path.write_bytes(json_dumps(self.dados))
+        except Exception as e:
+            print(f"[AVISO] Não foi possível salvar o JSON bruto: {str(e)}")
 
 
 class ProcessadorThread(QThread):
@@ -34,21 +132,40 @@ class ProcessadorThread(QThread):
         self.json_bruto_path = paths["bruto"]
         self.json_limpo_path = paths["limpo"]
     
+    def _extrair_em_outro_processo(self) -> dict:
+        """
+        Executa a extração (CPU-bound, Python puro) em outro processo.
+        Esta thread apenas aguarda o resultado, sem disputar o GIL com a interface.
+        """
+        global _EXECUTOR_EXTRACAO
+        # Módulo leve: as bibliotecas de PDF só são carregadas no processo auxiliar
+        from Extrator.ExtrairPDF import extrair_pdf
+        
+        try:
+            futuro = _obter_executor_extracao().submit(extrair_pdf, str(self.pdf_path))
+            return futuro.result()
+        except BrokenProcessPool as e:
+            # Processo auxiliar morreu: descarta o executor para recriar no próximo PDF
+            _EXECUTOR_EXTRACAO = None
+            raise Exception(f"Processo de extração encerrado inesperadamente: {str(e)}")
+    
     def run(self):
         """Executa o processamento completo do PDF"""
         try:
+            # Import sob demanda dentro do try: uma falha cai no tratamento de erro
+            from Extrator.LimparJson import PDFCompanyExtractor
+            
             # Etapa 1: Extração
             self.progresso.emit("📄 Extraindo dados do PDF...")
-            extractor = PDFExtractor(str(self.pdf_path))
-            extractor.save_to_json(self.json_bruto_path)
+            pdf_json_bruto = self._extrair_em_outro_processo()
             
             # Etapa 2: Limpeza
+            # JSON bruto é salvo em disco apenas para depuração, fora do caminho
+            # crítico; a limpeza usa o dicionário em memória (somente leitura)
             self.progresso.emit("📄 Processando tabelas...")
-            try:
-                with open(self.json_bruto_path, "r", encoding="utf-8") as f:
-                    pdf_json_bruto = json.load(f)
-            except Exception as e:
-                raise Exception(f"Erro ao ler JSON bruto: {str(e)}")
+            QThreadPool.globalInstance().start(
+                SalvarJsonBrutoTask(self.json_bruto_path, pdf_json_bruto)
+            )
             
             self.progresso.emit("📋 Estruturando informações...")
             try:
@@ -89,11 +206,16 @@ class TelaInicial(QWidget):
         self._ajustar_tamanho_janela()
         
         self.setAcceptDrops(True)
+        self._drop_hover_ativo = False
         self.apply_light_theme()
         self._build_ui()
         
         self.thread_processamento = None
         self.tela_informacoes = None
+        
+        # Diálogos reaproveitados entre interações (criados no primeiro uso)
+        self._msg_box: Optional[QMessageBox] = None
+        self._file_dialog: Optional[QFileDialog] = None
     
     def _ajustar_tamanho_janela(self):
         """Ajusta o tamanho da janela baseado nas dimensões do monitor"""
@@ -162,45 +284,34 @@ class TelaInicial(QWidget):
         container_layout.addWidget(subtitulo)
         
         # Área de drop com card
-        drop_card = QFrame()
-        drop_card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 16px;
-                border: 3px dashed #bdc3c7;
-            }
-        """)
-        drop_layout = QVBoxLayout(drop_card)
+        self.drop_card = QFrame()
+        self.drop_card.setObjectName("dropCard")
+        self.drop_card.setProperty("hover", False)
+        self.drop_card.setStyleSheet(_ESTILO_DROP_CARD)
+        drop_layout = QVBoxLayout(self.drop_card)
         drop_layout.setContentsMargins(40, 60, 40, 60)
         
         self.drop_area = QLabel("📄\n\nArraste o arquivo PDF aqui\nou clique no botão abaixo")
         self.drop_area.setFont(QFont("Segoe UI", 14))
         self.drop_area.setAlignment(Qt.AlignCenter)
-        self.drop_area.setStyleSheet("color: #95a5a6; border: none;")
+        self.drop_area.setObjectName("dropTexto")
+        self.drop_area.setProperty("hover", False)
         drop_layout.addWidget(self.drop_area)
         
-        container_layout.addWidget(drop_card)
-        
-        # Barra de progresso
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setMinimum(0)
-        self.progress_bar.setMaximum(0)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                background-color: #ecf0f1;
-                border-radius: 6px;
-                text-align: center;
-                color: #2c3e50;
-                height: 35px;
-                border: 1px solid #dfe6e9;
-            }
-            QProgressBar::chunk {
-                background-color: #00adef;
-                border-radius: 6px;
-            }
-        """)
-        self.progress_bar.setVisible(False)
-        container_layout.addWidget(self.progress_bar)
+        container_layout.addWidget(self.drop_card)
+        
+        # Indicador de processamento
+        self.spinner_label = QLabel(_QUADROS_SPINNER[0])
+        self.spinner_label.setFont(QFont("Segoe UI", 16))
+        self.spinner_label.setAlignment(Qt.AlignCenter)
+        self.spinner_label.setStyleSheet(_ESTILO_SPINNER)
+        self.spinner_label.setVisible(False)
+        container_layout.addWidget(self.spinner_label)
+        
+        self._spinner_quadro = 0
+        self._spinner_timer = QTimer(self)
+        self._spinner_timer.setInterval(_INTERVALO_SPINNER_MS)
+        self._spinner_timer.timeout.connect(self._avancar_spinner)
         
         # Label de status
         self.status_label = QLabel("")
@@ -214,25 +325,7 @@ class TelaInicial(QWidget):
         self.btn_selecionar.setFont(QFont("Segoe UI", 13, QFont.Medium))
         self.btn_selecionar.setMinimumHeight(55)
         self.btn_selecionar.setCursor(Qt.PointingHandCursor)
-        self.btn_selecionar.setStyleSheet("""
-            QPushButton {
-                background-color: #00adef;
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 15px 30px;
-            }
-            QPushButton:hover {
-                background-color: #0099d6;
-            }
-            QPushButton:pressed {
-                background-color: #0088bd;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                color: #ecf0f1;
-            }
-        """)
+        self.btn_selecionar.setStyleSheet(_ESTILO_BOTAO_PRINCIPAL)
         self.btn_selecionar.clicked.connect(self.selecionar_arquivo)
         container_layout.addWidget(self.btn_selecionar)
         
@@ -266,12 +359,7 @@ class TelaInicial(QWidget):
     def _criar_header(self):
         """Cria header com logo fixa"""
         header = QFrame()
-        header.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-bottom: 1px solid #e1e8ed;
-            }
-        """)
+        header.setStyleSheet(_ESTILO_HEADER)
         header.setMinimumHeight(100)
         
         header_layout = QHBoxLayout(header)
@@ -279,21 +367,13 @@ class TelaInicial(QWidget):
         
         # Logo fixa
         logo_label = QLabel()
-        logo_path = Path(__file__).parent / "img" / "logo.png"
-        
-        if logo_path.exists():
-            pixmap = QPixmap(str(logo_path))
-            if not pixmap.isNull():
-                # Redimensiona mantendo proporção
-                pixmap = pixmap.scaled(200, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                logo_label.setPixmap(pixmap)
-            else:
-                logo_label.setText("Logo")
-                logo_label.setStyleSheet("color: #00adef; font-size: 16px; font-weight: bold;")
+        pixmap = obter_logo()
+        
+        if pixmap is not None:
+            logo_label.setPixmap(pixmap)
         else:
             logo_label.setText("Logo")
             logo_label.setStyleSheet("color: #00adef; font-size: 16px; font-weight: bold;")
-            print(f"[AVISO] Logo não encontrada em: {logo_path}")
         
         logo_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         header_layout.addWidget(logo_label)
@@ -313,50 +393,40 @@ class TelaInicial(QWidget):
         btn.setFont(QFont("Segoe UI", 11))
         btn.setMinimumHeight(50)
         btn.setCursor(Qt.PointingHandCursor)
-        btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #2c3e50;
-                border: 2px solid #00adef;
-                border-radius: 10px;
-                padding: 12px 25px;
-            }
-            QPushButton:hover {
-                background-color: #f0f9ff;
-                border-color: #0099d6;
-            }
-            QPushButton:pressed {
-                background-color: #e0f2ff;
-            }
-        """)
+        btn.setStyleSheet(_ESTILO_BOTAO_SECUNDARIO)
         btn.clicked.connect(callback)
         return btn
     
+    def _definir_hover_drop(self, ativo: bool):
+        """Alterna o estado visual do card de drop sem reprocessar stylesheets"""
+        self._drop_hover_ativo = ativo
+        for widget in (self.drop_card, self.drop_area):
+            widget.setProperty("hover", ativo)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+    
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Evento ao arrastar arquivo"""
-        if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            if urls and urls[0].toLocalFile().lower().endswith('.pdf'):
-                event.acceptProposedAction()
-                self.drop_area.parentWidget().setStyleSheet("""
-                    QFrame {
-                        background-color: #f0f9ff;
-                        border-radius: 16px;
-                        border: 3px dashed #00adef;
-                    }
-                """)
-                self.drop_area.setStyleSheet("color: #00adef; border: none;")
+        mime_data = event.mimeData()
+        if not mime_data.hasUrls():
+            return
+        
+        urls = mime_data.urls()
+        if not urls or not urls[0].fileName().lower().endswith('.pdf'):
+            return
+        
+        event.acceptProposedAction()
+        
+        # Só troca o estilo na transição para o estado de hover
+        if not self._drop_hover_ativo:
+            self._definir_hover_drop(True)
     
     def dragLeaveEvent(self, event):
         """Evento ao sair da área"""
-        self.drop_area.parentWidget().setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 16px;
-                border: 3px dashed #bdc3c7;
-            }
-        """)
-        self.drop_area.setStyleSheet("color: #95a5a6; border: none;")
+        if not self._drop_hover_ativo:
+            return
+        
+        self._definir_hover_drop(False)
     
     def dropEvent(self, event: QDropEvent):
         """Evento ao soltar arquivo"""
@@ -368,26 +438,44 @@ class TelaInicial(QWidget):
             if file_path.lower().endswith('.pdf'):
                 self.processar_pdf(Path(file_path))
             else:
-                QMessageBox.warning(self, "Erro", "Por favor, selecione um arquivo PDF.")
+                self._mostrar_mensagem(QMessageBox.Warning, "Erro", "Por favor, selecione um arquivo PDF.")
+    
+    def _mostrar_mensagem(self, icone, titulo: str, texto: str,
+                          botoes=QMessageBox.Ok, botao_padrao=QMessageBox.NoButton):
+        """Exibe a caixa de mensagem reaproveitada e retorna o botão escolhido"""
+        if self._msg_box is None:
+            self._msg_box = QMessageBox(self)
+        
+        self._msg_box.setIcon(icone)
+        self._msg_box.setWindowTitle(titulo)
+        self._msg_box.setText(texto)
+        self._msg_box.setStandardButtons(botoes)
+        self._msg_box.setDefaultButton(botao_padrao)
+        self._msg_box.exec()
+        
+        clicado = self._msg_box.clickedButton()
+        return self._msg_box.standardButton(clicado) if clicado else QMessageBox.NoButton
     
     def selecionar_arquivo(self):
         """Abre diálogo para selecionar arquivo"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Selecionar arquivo PDF",
-            "",
-            "Arquivos PDF (*.pdf)"
-        )
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self, "Selecionar arquivo PDF")
+            self._file_dialog.setFileMode(QFileDialog.ExistingFile)
+            self._file_dialog.setNameFilter("Arquivos PDF (*.pdf)")
         
-        if file_path:
-            self.processar_pdf(Path(file_path))
+        if not self._file_dialog.exec():
+            return
+        
+        arquivos = self._file_dialog.selectedFiles()
+        if arquivos:
+            self.processar_pdf(Path(arquivos[0]))
     
     def processar_pdf(self, pdf_path: Path):
         """Inicia o processamento do PDF"""
         self.btn_selecionar.setEnabled(False)
         self.setAcceptDrops(False)
         
-        self.progress_bar.setVisible(True)
+        self._iniciar_spinner()
         self.status_label.setText("Iniciando processamento...")
         
         self.thread_processamento = ProcessadorThread(pdf_path)
@@ -395,6 +483,23 @@ class TelaInicial(QWidget):
         self.thread_processamento.concluido.connect(self.processamento_concluido)
         self.thread_processamento.start()
     
+    def _iniciar_spinner(self):
+        """Exibe o indicador de processamento e inicia a animação"""
+        self._spinner_quadro = 0
+        self.spinner_label.setText(_QUADROS_SPINNER[0])
+        self.spinner_label.setVisible(True)
+        self._spinner_timer.start()
+    
+    def _parar_spinner(self):
+        """Para a animação e oculta o indicador de processamento"""
+        self._spinner_timer.stop()
+        self.spinner_label.setVisible(False)
+    
+    def _avancar_spinner(self):
+        """Mostra o próximo quadro do indicador"""
+        self._spinner_quadro = (self._spinner_quadro + 1) % len(_QUADROS_SPINNER)
+        self.spinner_label.setText(_QUADROS_SPINNER[self._spinner_quadro])
+    
     def atualizar_progresso(self, mensagem: str):
         """Atualiza mensagem de progresso"""
         self.status_label.setText(mensagem)
@@ -403,17 +508,17 @@ class TelaInicial(QWidget):
         """Callback de conclusão"""
         self.btn_selecionar.setEnabled(True)
         self.setAcceptDrops(True)
-        self.progress_bar.setVisible(False)
+        self._parar_spinner()
         
         if sucesso:
             self.status_label.setText("✅ Processamento concluído!")
             self.status_label.setStyleSheet("color: #27ae60;")
-            QMessageBox.information(self, "Sucesso", mensagem)
+            self._mostrar_mensagem(QMessageBox.Information, "Sucesso", mensagem)
             self.abrir_tela_informacoes()
         else:
             self.status_label.setText("❌ Erro no processamento")
             self.status_label.setStyleSheet("color: #e74c3c;")
-            QMessageBox.critical(self, "Erro", mensagem)
+            self._mostrar_mensagem(QMessageBox.Critical, "Erro", mensagem)
     
     def abrir_dados_existentes(self):
         """Abre dados já processados"""
@@ -421,8 +526,8 @@ class TelaInicial(QWidget):
         json_limpo_path = paths["limpo"]
         
         if not json_limpo_path.exists():
-            QMessageBox.warning(
-                self,
+            self._mostrar_mensagem(
+                QMessageBox.Warning,
                 "Dados não encontrados",
                 "Nenhum dado foi encontrado.\n\nProcesse um PDF primeiro."
             )
@@ -436,8 +541,8 @@ class TelaInicial(QWidget):
         json_limpo_path = paths["limpo"]
         
         if not json_limpo_path.exists():
-            resposta = QMessageBox.question(
-                self,
+            resposta = self._mostrar_mensagem(
+                QMessageBox.Question,
                 "Dados não encontrados",
                 "A automação SAP requer dados de fornecedor.\n\nDeseja processar um PDF agora?",
                 QMessageBox.Yes | QMessageBox.No,
@@ -449,14 +554,16 @@ class TelaInicial(QWidget):
             return
         
         self.abrir_tela_informacoes()
-        QMessageBox.information(
-            self,
+        self._mostrar_mensagem(
+            QMessageBox.Information,
             "Automação SAP",
             "Verifique se todos os campos obrigatórios estão preenchidos.\n\nOs dados serão padronizados automaticamente ao clicar em 'Iniciar Automação SAP'."
         )
     
     def abrir_tela_informacoes(self):
         """Abre tela de informações"""
+        from layout.TelaInformacoes import TelaInformacoes
+        
         paths = get_json_paths()
         json_limpo_path = paths["limpo"]
         
@@ -466,12 +573,4 @@ class TelaInicial(QWidget):
     
     def apply_light_theme(self):
         """Aplica tema claro"""
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor("#f5f7fa"))
-        palette.setColor(QPalette.Base, QColor("#ffffff"))
-        palette.setColor(QPalette.Text, QColor("#2c3e50"))
-        palette.setColor(QPalette.Button, QColor("#ffffff"))
-        palette.setColor(QPalette.ButtonText, QColor("#2c3e50"))
-        palette.setColor(QPalette.Highlight, QColor("#00adef"))
-        palette.setColor(QPalette.HighlightedText, QColor("#ffffff"))
-        self.setPalette(palette)
\ No newline at end of file
+        self.setPalette(obter_paleta_clara())
\ No newline at end of file
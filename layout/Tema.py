@@ -0,0 +1,67 @@
+"""
+Tema visual compartilhado entre as telas da aplicação.
+"""
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPalette, QColor, QPixmap
+
+# Cores do tema claro (papel da paleta, cor)
+CORES_TEMA_CLARO = (
+    (QPalette.Window, QColor("#f5f7fa")),
+    (QPalette.Base, QColor("#ffffff")),
+    (QPalette.Text, QColor("#2c3e50")),
+    (QPalette.Button, QColor("#ffffff")),
+    (QPalette.ButtonText, QColor("#2c3e50")),
+    (QPalette.Highlight, QColor("#00adef")),
+    (QPalette.HighlightedText, QColor("#ffffff")),
+)
+
+# Paleta criada na primeira chamada (requer QApplication já instanciada)
+_PALETA_CLARA: Optional[QPalette] = None
+
+
+def obter_paleta_clara() -> QPalette:
+    """Retorna a paleta do tema claro"""
+    global _PALETA_CLARA
+
+    if _PALETA_CLARA is None:
+        _PALETA_CLARA = QPalette()
+        for papel, cor in CORES_TEMA_CLARO:
+            _PALETA_CLARA.setColor(papel, cor)
+    return _PALETA_CLARA
+
+
+# Logo do header já redimensionada, compartilhada entre as telas
+_LOGO_CACHE: Optional[QPixmap] = None
+_LOGO_VERIFICADA = False
+
+
+def obter_logo() -> Optional[QPixmap]:
+    """Retorna a logo do header (ou None), lendo o disco só na primeira vez"""
+    global _LOGO_CACHE, _LOGO_VERIFICADA
+
+    if _LOGO_VERIFICADA:
+        return _LOGO_CACHE
+
+    _LOGO_VERIFICADA = True
+    pasta_img = Path(__file__).parent / "img"
+
+    # Versão já reduzida para caber em 200x60 (158x60, proporção da logo.png)
+    logo_pronta = QPixmap(str(pasta_img / "logo_158x60.png"))
+    if not logo_pronta.isNull():
+        _LOGO_CACHE = logo_pronta
+        return _LOGO_CACHE
+
+    logo_path = pasta_img / "logo.png"
+    if not logo_path.exists():
+        print(f"[AVISO] Logo não encontrada em: {logo_path}")
+        return None
+
+    pixmap = QPixmap(str(logo_path))
+    if not pixmap.isNull():
+        # Redimensiona mantendo proporção
+        _LOGO_CACHE = pixmap.scaled(200, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    return _LOGO_CACHE
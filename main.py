@@ -1,13 +1,23 @@
 import sys
 import os
-from pathlib import Path
+
+# Registra o diretório raiz no path antes dos imports do projeto
+from _bootstrap import ROOT_DIR
 from PySide6.QtWidgets import QApplication
 from layout.TelaInicial import TelaInicial
 
-# Adiciona o diretório raiz ao path para imports
-ROOT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(ROOT_DIR))
 
+def _informar_modo_gil():
+    """Informa se o interpretador roda sem GIL (build free-threaded, PEP 703)"""
+    gil_ativo = getattr(sys, "_is_gil_enabled", None)
+    
+    if gil_ativo is not None and not gil_ativo():
+        print("[INFO] Python free-threaded: GIL desativado")
+        return
+    
+    # Com GIL, a extração do PDF já roda em um processo separado
+    # (ProcessadorThread), então a interface não disputa o GIL com ela
+    print("[INFO] GIL ativo: extração do PDF executada em processo separado")
 
 
 def main():
@@ -16,6 +26,7 @@ def main():
     Inicializa a interface gráfica com tela de drag & drop.
     """
     app = QApplication(sys.argv)
+    _informar_modo_gil()
     
     # Define o estilo global da aplicação
     app.setStyle("Fusion")
@@ -1,9 +1,11 @@
 """
 Script de teste para verificar a estrutura do JSON gerado
 """
-import json
 from pathlib import Path
 
+# orjson (se instalado) via utils, com fallback para json da stdlib
+from utils import json_loads, json_dumps
+
 # Caminho do JSON limpo
 json_path = Path(__file__).parent / "Arquivos" / "fornecedor_limpo.json"
 
@@ -11,8 +13,7 @@ print(f"Verificando arquivo: {json_path}")
 print(f"Arquivo existe: {json_path.exists()}\n")
 
 if json_path.exists():
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = json_loads(json_path.read_bytes())
     
     print("=" * 60)
     print("ESTRUTURA DO JSON")
@@ -33,7 +34,7 @@ if json_path.exists():
     print("\n" + "=" * 60)
     print("JSON COMPLETO:")
     print("=" * 60)
-    print(json.dumps(data, indent=2, ensure_ascii=False))
+    print(json_dumps(data).decode("utf-8"))
 else:
     print("❌ Arquivo não encontrado!")
     print("\nCrie um JSON de teste com:")
@@ -56,13 +56,23 @@ def instalar_modulo_sap():
     # (assumindo que estão no mesmo diretório do script de instalação)
     arquivos_fonte = Path(__file__).parent
     
+    # Uma única listagem do diretório em vez de um stat por arquivo
+    necessarios = set(arquivos_necessarios)
+    with os.scandir(arquivos_fonte) as entradas:
+        encontrados = {
+            entrada.name: entrada.path
+            for entrada in entradas
+            if entrada.name in necessarios and entrada.is_file()
+        }
+    
     print("\n📋 Copiando arquivos...")
     for arquivo in arquivos_necessarios:
-        fonte = arquivos_fonte / arquivo
-        destino = sap_dir / arquivo
+        fonte = encontrados.get(arquivo)
         
-        if fonte.exists():
-            shutil.copy2(fonte, destino)
+        if fonte is not None:
+            # copyfile copia só o conteúdo (sem metadados) e já usa cópia
+            # em kernel (sendfile/fcopyfile) quando a plataforma oferece
+            shutil.copyfile(fonte, sap_dir / arquivo)
             print(f"   ✅ {arquivo}")
         else:
             print(f"   ⚠️  {arquivo} - NÃO ENCONTRADO (baixe manualmente)")
@@ -73,7 +83,7 @@ def instalar_modulo_sap():
     
     if campos_sap.exists():
         print("\n📄 Movendo campos_sap.json para SAP/...")
-        shutil.copy2(campos_sap, campos_sap_destino)
+        shutil.copyfile(campos_sap, campos_sap_destino)
         print("   ✅ campos_sap.json copiado")
     else:
         print("\n⚠️  campos_sap.json não encontrado na raiz")
@@ -0,0 +1,65 @@
+"""
+Testes dos validadores e máscaras dos campos de entrada.
+"""
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QTest
+
+from validadores import aplicar_validador, aplicar_mascara_automatica, texto_do_campo
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def _campo(tipo_campo):
+    campo = QtWidgets.QLineEdit()
+    aplicar_validador(campo, tipo_campo)
+    aplicar_mascara_automatica(campo, tipo_campo)
+    return campo
+
+
+@pytest.mark.parametrize("tipo_campo, digitado, esperado", [
+    ("cnpj", "123", "123"),
+    ("cep", "123", "123"),
+    ("cnpj", "", ""),
+    ("cep", "", ""),
+])
+def test_mascara_incompleta_sem_separadores(app, tipo_campo, digitado, esperado):
+    campo = _campo(tipo_campo)
+    campo.insert(digitado)
+    assert texto_do_campo(campo) == esperado
+
+
+@pytest.mark.parametrize("tipo_campo, digitado, esperado", [
+    ("cnpj", "12345678000190", "12.345.678/0001-90"),
+    ("cep", "01310100", "01310-100"),
+])
+def test_mascara_completa_formatada(app, tipo_campo, digitado, esperado):
+    campo = _campo(tipo_campo)
+    campo.insert(digitado)
+    assert texto_do_campo(campo) == esperado
+
+
+@pytest.mark.parametrize("tipo_campo, digitado, esperado", [
+    ("cnpj", "12345678000190", "12.345.678/0001-90"),
+    ("cep", "01310100", "01310-100"),
+])
+def test_sem_mascara_nativa_formata_no_fixup(app, tipo_campo, digitado, esperado):
+    campo = QtWidgets.QLineEdit()
+    aplicar_validador(campo, tipo_campo)
+    aplicar_mascara_automatica(campo, tipo_campo, mascara_nativa=False)
+    assert not campo.inputMask()
+    
+    # Sem formatação enquanto digita; o Enter conclui a edição e aciona o fixup
+    QTest.keyClicks(campo, digitado)
+    assert campo.text() == digitado
+    QTest.keyClick(campo, Qt.Key_Return)
+    assert campo.text() == esperado
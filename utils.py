@@ -1,12 +1,23 @@
 """
 Funções auxiliares compartilhadas entre os módulos do projeto.
 """
+import json
+from functools import lru_cache
 from pathlib import Path
 
+# Tentar importar orjson (opcional, parser/serializador JSON mais rápido)
+try:
+    import orjson
+    ORJSON_DISPONIVEL = True
+except ImportError:
+    ORJSON_DISPONIVEL = False
 
+
+@lru_cache(maxsize=None)
 def get_project_root(start_path: Path = None) -> Path:
     """
     Encontra o diretório raiz do projeto procurando por main.py.
+    O resultado é memorizado: a busca no disco ocorre uma vez por caminho.
     
     Args:
         start_path: Caminho inicial para busca (padrão: arquivo atual)
@@ -37,9 +48,11 @@ def get_project_root(start_path: Path = None) -> Path:
     return Path(__file__).resolve().parent
 
 
+@lru_cache(maxsize=None)
 def get_arquivos_dir(create: bool = True) -> Path:
     """
     Retorna o caminho para o diretório Arquivos/.
+    Memorizado: o diretório é verificado/criado só na primeira chamada.
     
     Args:
         create: Se True, cria o diretório caso não exista
@@ -70,6 +83,7 @@ def get_json_paths() -> dict:
     }
 
 
+@lru_cache(maxsize=None)
 def get_anexos_json_path() -> Path:
     """
     Retorna o caminho para o arquivo JSON de anexos.
@@ -77,4 +91,35 @@ def get_anexos_json_path() -> Path:
     Returns:
         Path para fornecedor_anexos.json
     """
-    return get_arquivos_dir() / "fornecedor_anexos.json"
\ No newline at end of file
+    return get_arquivos_dir() / "fornecedor_anexos.json"
+
+
+def json_loads(conteudo: bytes):
+    """
+    Desserializa JSON usando orjson quando disponível.
+    
+    Args:
+        conteudo: Bytes (UTF-8) do documento JSON
+    
+    Returns:
+        Objeto Python correspondente
+    """
+    if ORJSON_DISPONIVEL:
+        return orjson.loads(conteudo)
+    return json.loads(conteudo)
+
+
+def json_dumps(dados) -> bytes:
+    """
+    Serializa JSON em UTF-8 com indentação de 2 espaços.
+    Usa orjson quando disponível.
+    
+    Args:
+        dados: Objeto a serializar
+    
+    Returns:
+        Bytes do documento JSON
+    """
+    if ORJSON_DISPONIVEL:
+        return orjson.dumps(dados, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(dados, ensure_ascii=False, indent=2).encode("utf-8")
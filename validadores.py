@@ -3,97 +3,139 @@ Validadores e formatadores para campos de entrada.
 Fornece máscaras automáticas e validação de dados.
 """
 import re
+import string
+import weakref
+from functools import lru_cache
 from PySide6.QtGui import QValidator
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
+# Fallback de somente_digitos para texto não-ASCII
+_NON_DIGIT = re.compile(r'\D')
 
-class CNPJValidator(QValidator):
-    """Validador para CNPJ com máscara automática"""
+# Caracteres aceitos nos campos bancários (teste de conjunto em C, sem regex)
+_AGENCIA_OK = frozenset(string.digits + ".-")
+_CONTA_OK = frozenset(string.digits + "-" + string.whitespace)
+
+# Tabela para str.translate: remove todo caractere ASCII que não é dígito
+_KEEP_DIGITS = str.maketrans({c: None for c in map(chr, range(128)) if not c.isdigit()})
+
+
+def somente_digitos(text: str) -> str:
+    """
+    Extrai apenas os dígitos do texto (uma passada em C, sem regex).
     
-    def validate(self, text, pos):
-        # Remove caracteres não numéricos
-        numbers = re.sub(r'\D', '', text)
-        
-        # Limita a 14 dígitos
-        if len(numbers) > 14:
-            return (QValidator.Invalid, text, pos)
-        
-        return (QValidator.Acceptable, text, pos)
+    Args:
+        text: texto de onde os dígitos serão extraídos
     
-    @staticmethod
-    def format(text):
-        """Formata CNPJ: 00.000.000/0000-00"""
-        numbers = re.sub(r'\D', '', text)
-        
-        if len(numbers) <= 2:
-            return numbers
-        elif len(numbers) <= 5:
-            return f"{numbers[:2]}.{numbers[2:]}"
-        elif len(numbers) <= 8:
-            return f"{numbers[:2]}.{numbers[2:5]}.{numbers[5:]}"
-        elif len(numbers) <= 12:
-            return f"{numbers[:2]}.{numbers[2:5]}.{numbers[5:8]}/{numbers[8:]}"
-        else:
-            return f"{numbers[:2]}.{numbers[2:5]}.{numbers[5:8]}/{numbers[8:12]}-{numbers[12:14]}"
-
-
-class CEPValidator(QValidator):
-    """Validador para CEP com máscara automática"""
+    Returns:
+        String contendo somente os dígitos, na ordem original
+    """
+    numbers = text.translate(_KEEP_DIGITS)
+    if not numbers.isascii():
+        # Caracteres não-ASCII são raros: delega ao regex para manter a semântica
+        numbers = _NON_DIGIT.sub('', numbers)
+    return numbers
+
+
+# Formatadores indexados pela quantidade de dígitos (um acesso por tecla,
+# sem cadeia de if/elif); entradas maiores usam o último formato
+_FORMATOS_CNPJ = (
+    (lambda n: n,) * 3                                               # 0-2
+    + (lambda n: f"{n[:2]}.{n[2:]}",) * 3                            # 3-5
+    + (lambda n: f"{n[:2]}.{n[2:5]}.{n[5:]}",) * 3                   # 6-8
+    + (lambda n: f"{n[:2]}.{n[2:5]}.{n[5:8]}/{n[8:]}",) * 4          # 9-12
+    + (lambda n: f"{n[:2]}.{n[2:5]}.{n[5:8]}/{n[8:12]}-{n[12:14]}",) * 2  # 13-14
+)
+
+_FORMATOS_CEP = (
+    (lambda n: n,) * 6                                               # 0-5
+    + (lambda n: f"{n[:5]}-{n[5:8]}",) * 3                           # 6-8
+)
+
+_FORMATOS_TELEFONE = (
+    (lambda n: "",)                                                  # 0
+    + (lambda n: f"({n}",) * 2                                       # 1-2
+    + (lambda n: f"({n[:2]}) {n[2:]}",) * 4                          # 3-6
+    + (lambda n: f"({n[:2]}) {n[2:6]}-{n[6:]}",) * 4                 # 7-10
+    + (lambda n: f"({n[:2]}) {n[2:7]}-{n[7:11]}",)                   # 11 (celular com 9)
+)
+
+
+class _ValidadorDigitos(QValidator):
+    """
+    Base dos validadores com máscara (CNPJ, CEP, telefone).
+    
+    Guarda os dígitos do último texto validado: o formatador chamado logo em
+    seguida (textChanged) para o mesmo texto reaproveita o resultado.
+    
+    Com formatar_no_fixup=True, texto ainda não formatado é Intermediate e a
+    formatação fica para o fixup, que o Qt chama ao concluir a edição.
+    """
+    
+    MAX_DIGITOS = 0
+    FORMATOS = ()
+    
+    def __init__(self, formatar_no_fixup: bool = False):
+        super().__init__()
+        self._formatar_no_fixup = formatar_no_fixup
+        self._ultimo_texto = None
+        self._ultimos_digitos = ""
+    
+    def _digitos(self, text):
+        """Dígitos do texto, reaproveitando a última extração se o texto for o mesmo"""
+        if text != self._ultimo_texto:
+            self._ultimo_texto = text
+            self._ultimos_digitos = somente_digitos(text)
+        return self._ultimos_digitos
     
     def validate(self, text, pos):
-        numbers = re.sub(r'\D', '', text)
-        
-        if len(numbers) > 8:
+        # Limita a quantidade de dígitos (caracteres não numéricos são ignorados)
+        if len(self._digitos(text)) > self.MAX_DIGITOS:
             return (QValidator.Invalid, text, pos)
         
+        if self._formatar_no_fixup and self.formatar(text) != text:
+            return (QValidator.Intermediate, text, pos)
+        
         return (QValidator.Acceptable, text, pos)
     
-    @staticmethod
-    def format(text):
-        """Formata CEP: 00000-000"""
-        numbers = re.sub(r'\D', '', text)
-        
-        if len(numbers) <= 5:
-            return numbers
-        else:
-            return f"{numbers[:5]}-{numbers[5:8]}"
+    def fixup(self, text):
+        """Formata o texto ao concluir a edição (foco perdido ou Enter)"""
+        return self.formatar(text)
+    
+    def formatar(self, text):
+        """Formata o texto usando os dígitos já extraídos em validate"""
+        numbers = self._digitos(text)
+        return self.FORMATOS[min(len(numbers), self.MAX_DIGITOS)](numbers)
 
 
-class TelefoneValidator(QValidator):
-    """Validador para telefone/celular com máscara automática"""
+class CNPJValidator(_ValidadorDigitos):
+    """Validador para CNPJ com máscara automática"""
     
-    def validate(self, text, pos):
-        numbers = re.sub(r'\D', '', text)
-        
-        # Permite até 11 dígitos (celular com 9)
-        if len(numbers) > 11:
-            return (QValidator.Invalid, text, pos)
-        
-        return (QValidator.Acceptable, text, pos)
+    MAX_DIGITOS = 14
+    FORMATOS = _FORMATOS_CNPJ
+
+
+class CEPValidator(_ValidadorDigitos):
+    """Validador para CEP com máscara automática"""
     
-    @staticmethod
-    def format(text):
-        """Formata telefone: (00) 0000-0000 ou (00) 00000-0000"""
-        numbers = re.sub(r'\D', '', text)
-        
-        if len(numbers) <= 2:
-            return f"({numbers}" if numbers else ""
-        elif len(numbers) <= 6:
-            return f"({numbers[:2]}) {numbers[2:]}"
-        elif len(numbers) <= 10:
-            return f"({numbers[:2]}) {numbers[2:6]}-{numbers[6:]}"
-        else:
-            # Celular com 9 dígitos
-            return f"({numbers[:2]}) {numbers[2:7]}-{numbers[7:11]}"
+    MAX_DIGITOS = 8
+    FORMATOS = _FORMATOS_CEP
+
+
+class TelefoneValidator(_ValidadorDigitos):
+    """Validador para telefone/celular com máscara automática"""
+    
+    # Permite até 11 dígitos (celular com 9)
+    MAX_DIGITOS = 11
+    FORMATOS = _FORMATOS_TELEFONE
 
 
 class NumeroValidator(QValidator):
     """Validador para números inteiros positivos"""
     
     def validate(self, text, pos):
-        if text == "" or text.isdigit():
-            return (QValidator.Acceptable, text, pos)
-        return (QValidator.Invalid, text, pos)
+        ok = not text or text.isdigit()
+        return (QValidator.Acceptable if ok else QValidator.Invalid, text, pos)
 
 
 class TextoLimitadoValidator(QValidator):
@@ -113,14 +155,9 @@ class CodigoBancoValidator(QValidator):
     """Validador para código do banco (máximo 3 dígitos)"""
     
     def validate(self, text, pos):
-        # Permite vazio ou até 3 dígitos
-        if text == "":
-            return (QValidator.Acceptable, text, pos)
-        
-        if text.isdigit() and len(text) <= 3:
-            return (QValidator.Acceptable, text, pos)
-        
-        return (QValidator.Invalid, text, pos)
+        # Permite vazio ou até 3 dígitos (tamanho testado antes de varrer o texto)
+        ok = len(text) <= 3 and (not text or (text.isascii() and text.isdigit()))
+        return (QValidator.Acceptable if ok else QValidator.Invalid, text, pos)
 
 
 class AgenciaLimitadaValidator(QValidator):
@@ -128,36 +165,60 @@ class AgenciaLimitadaValidator(QValidator):
     
     def validate(self, text, pos):
         # Permite números, pontos, hífens, mas limita o tamanho
-        if not re.match(r'^[\d\.\-]*$', text):
+        if not _AGENCIA_OK.issuperset(text):
             return (QValidator.Invalid, text, pos)
         
-        # Remove caracteres não numéricos para verificar tamanho
-        numeros = re.sub(r'\D', '', text)
-        if len(numeros) <= 4:
+        # Só restam dígitos, pontos e hífens: desconta os separadores
+        digitos = len(text) - text.count('.') - text.count('-')
+        if digitos <= 4:
             return (QValidator.Acceptable, text, pos)
         
         return (QValidator.Invalid, text, pos)
 
 
+# Conjuntos de caracteres aceitos em cada parte de local@dominio.tld
+_EMAIL_LOCAL_OK = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMINIO_OK = frozenset(string.ascii_letters + string.digits + ".-")
+_EMAIL_TLD_OK = frozenset(string.ascii_letters)
+
+
+@lru_cache(maxsize=512)
+def _email_valid(email: str) -> bool:
+    """
+    Verifica local@dominio.tld em uma passada, sem regex (sem backtracking).
+    
+    Equivale a ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$
+    """
+    arroba = email.find('@')
+    if arroba < 1:
+        return False
+    
+    dominio = email[arroba + 1:]
+    ponto = dominio.rfind('.')
+    if ponto < 1 or len(dominio) - ponto - 1 < 2:
+        return False
+    
+    return (
+        _EMAIL_LOCAL_OK.issuperset(email[:arroba])
+        and _EMAIL_DOMINIO_OK.issuperset(dominio[:ponto])
+        and _EMAIL_TLD_OK.issuperset(dominio[ponto + 1:])
+    )
+
+
 class EmailValidator(QValidator):
     """Validador básico para email"""
     
-    EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-    
     def validate(self, text, pos):
-        if text == "":
-            return (QValidator.Intermediate, text, pos)
-        
-        if self.EMAIL_REGEX.match(text):
+        if text and _email_valid(text):
             return (QValidator.Acceptable, text, pos)
         
-        # Permite digitação parcial
+        # Vazio ou digitação parcial
         return (QValidator.Intermediate, text, pos)
     
     @staticmethod
     def is_valid(email):
         """Verifica se o email é válido"""
-        return bool(EmailValidator.EMAIL_REGEX.match(email))
+        return _email_valid(email)
 
 
 class ContaBancariaValidator(QValidator):
@@ -165,7 +226,7 @@ class ContaBancariaValidator(QValidator):
     
     def validate(self, text, pos):
         # Permite números, hífen e espaços
-        if re.match(r'^[\d\-\s]*$', text):
+        if _CONTA_OK.issuperset(text):
             return (QValidator.Acceptable, text, pos)
         return (QValidator.Invalid, text, pos)
 
@@ -175,11 +236,56 @@ class AgenciaValidator(QValidator):
     
     def validate(self, text, pos):
         # Permite números, pontos e hífens
-        if re.match(r'^[\d\.\-]*$', text):
+        if _AGENCIA_OK.issuperset(text):
             return (QValidator.Acceptable, text, pos)
         return (QValidator.Invalid, text, pos)
 
 
+# Validadores sem estado por campo: uma instância compartilhada por tipo
+# (QLineEdit.setValidator não assume a posse do validador)
+_VALIDADOR_CNPJ = CNPJValidator()
+_VALIDADOR_CEP = CEPValidator()
+_VALIDADOR_TELEFONE = TelefoneValidator()
+_VALIDADOR_NUMERO = NumeroValidator()
+_VALIDADOR_EMAIL = EmailValidator()
+_VALIDADOR_CONTA = ContaBancariaValidator()
+_VALIDADOR_AGENCIA = AgenciaValidator()
+_VALIDADOR_AGENCIA_LIMITADA = AgenciaLimitadaValidator()
+_VALIDADOR_CODIGO_BANCO = CodigoBancoValidator()
+
+# Limites de texto usados no formulário (razão social e nome fantasia)
+_TEXTO_40 = TextoLimitadoValidator(40)
+_TEXTO_20 = TextoLimitadoValidator(20)
+
+# Validador de cada tipo de campo (montado uma vez, consultado por campo)
+_VALIDADORES = {
+    'cnpj': _VALIDADOR_CNPJ,
+    'cep': _VALIDADOR_CEP,
+    'telefone': _VALIDADOR_TELEFONE,
+    'numero': _VALIDADOR_NUMERO,
+    'email': _VALIDADOR_EMAIL,
+    'conta': _VALIDADOR_CONTA,
+    'agencia': _VALIDADOR_AGENCIA,
+    'agencia_limitada': _VALIDADOR_AGENCIA_LIMITADA,
+    'codigo_banco': _VALIDADOR_CODIGO_BANCO,
+    'razao_social': _TEXTO_40,
+    'nome_fantasia': _TEXTO_20,
+}
+
+# Formatos fixos sem máscara nativa: formatados pelo fixup do validador ao
+# concluir a edição, sem slot em Python a cada tecla
+_VALIDADORES_FIXUP = {
+    'cnpj': CNPJValidator(formatar_no_fixup=True),
+    'cep': CEPValidator(formatar_no_fixup=True),
+}
+
+# Formatadores em Python (tamanho variável): métodos das instâncias
+# compartilhadas, que reaproveitam os dígitos já extraídos pelo validate
+_FORMATADORES = {
+    'telefone': _VALIDADOR_TELEFONE.formatar,
+}
+
+
 def aplicar_validador(campo, tipo_campo):
     """
     Aplica o validador apropriado ao campo baseado no tipo.
@@ -188,53 +294,99 @@ def aplicar_validador(campo, tipo_campo):
         campo: QLineEdit onde será aplicado o validador
         tipo_campo: string identificando o tipo ('cnpj', 'cep', 'telefone', etc.)
     """
-    validadores = {
-        'cnpj': CNPJValidator,
-        'cep': CEPValidator,
-        'telefone': TelefoneValidator,
-        'numero': NumeroValidator,
-        'email': EmailValidator,
-        'conta': ContaBancariaValidator,
-        'agencia': AgenciaValidator,
-        'agencia_limitada': AgenciaLimitadaValidator,
-        'codigo_banco': CodigoBancoValidator,
-    }
-    
-    # Validadores com parâmetros
-    if tipo_campo == 'razao_social':
-        campo.setValidator(TextoLimitadoValidator(40))
-    elif tipo_campo == 'nome_fantasia':
-        campo.setValidator(TextoLimitadoValidator(20))
-    elif tipo_campo in validadores:
-        campo.setValidator(validadores[tipo_campo]())
-
-
-def aplicar_mascara_automatica(campo, tipo_campo):
+    validador = _VALIDADORES.get(tipo_campo)
+    if validador is not None:
+        campo.setValidator(validador)
+
+
+# Máscaras nativas do Qt para formatos de tamanho fixo: a formatação acontece
+# dentro do QLineEdit (C++), sem passar pelo Python a cada tecla
+_MASCARAS_NATIVAS = {
+    'cnpj': "00.000.000/0000-00;_",
+    'cep': "00000-000;_",
+}
+
+
+def texto_do_campo(campo) -> str:
+    """
+    Retorna o texto do campo, tratando máscaras nativas.
+    
+    Com inputMask, QLineEdit.text() devolve os separadores mesmo com a máscara
+    incompleta (ex: "12.3./-"); nesse caso só os dígitos são considerados.
+    
+    Args:
+        campo: QLineEdit de onde o texto será lido
+    
+    Returns:
+        Texto do campo; se a máscara estiver incompleta, apenas os dígitos
+        digitados ("" se nenhum)
+    """
+    texto = campo.text()
+    mascara = campo.inputMask()
+    if not texto or not mascara:
+        return texto
+    
+    # hasAcceptableInput() é True mesmo com a máscara incompleta: compara os
+    # dígitos com as posições de dígito da máscara ("0")
+    digitos = somente_digitos(texto)
+    if len(digitos) == mascara.split(';', 1)[0].count('0'):
+        return texto
+    return digitos
+
+
+def aplicar_mascara_automatica(campo, tipo_campo, mascara_nativa: bool = True):
     """
     Configura formatação automática enquanto o usuário digita.
     
+    CNPJ e CEP usam inputMask do Qt (ou, sem ela, o fixup do validador);
+    telefone (8 ou 9 dígitos) é formatado em Python enquanto o usuário digita.
+    Deve ser chamada depois de aplicar_validador.
+    
     Args:
         campo: QLineEdit onde será aplicada a máscara
         tipo_campo: string identificando o tipo ('cnpj', 'cep', 'telefone')
+        mascara_nativa: se False, CNPJ e CEP são formatados pelo fixup
     """
-    formatadores = {
-        'cnpj': CNPJValidator.format,
-        'cep': CEPValidator.format,
-        'telefone': TelefoneValidator.format,
-    }
-    
-    if tipo_campo in formatadores:
-        formatador = formatadores[tipo_campo]
+    if mascara_nativa and tipo_campo in _MASCARAS_NATIVAS:
+        campo.setInputMask(_MASCARAS_NATIVAS[tipo_campo])
+        return
+    
+    validador_fixup = _VALIDADORES_FIXUP.get(tipo_campo)
+    if validador_fixup is not None:
+        campo.setValidator(validador_fixup)
+        return
+    
+    formatador = _FORMATADORES.get(tipo_campo)
+    if formatador is not None:
+        # Referência fraca: o slot não mantém o QLineEdit vivo após a tela fechar
+        ref_campo = weakref.ref(campo)
         
-        def formatar_texto():
-            cursor_pos = campo.cursorPosition()
-            texto_atual = campo.text()
+        def aplicar_formatacao():
+            c = ref_campo()
+            if c is None:
+                return
+            
+            cursor_pos = c.cursorPosition()
+            texto_atual = c.text()
             texto_formatado = formatador(texto_atual)
             
             # Evita loop infinito
             if texto_formatado != texto_atual:
-                campo.setText(texto_formatado)
+                c.setText(texto_formatado)
                 # Ajusta posição do cursor
-                campo.setCursorPosition(min(cursor_pos, len(texto_formatado)))
+                c.setCursorPosition(min(cursor_pos, len(texto_formatado)))
+            
+            # Liberado só depois do setText: o textChanged que ele dispara é ignorado
+            c._formatacao_pendente = False
+        
+        def formatar_texto():
+            c = ref_campo()
+            # Agrupa rajadas de textChanged (colar, IME) em uma única formatação,
+            # feita com o texto final quando o loop de eventos voltar
+            if c is None or c._formatacao_pendente:
+                return
+            c._formatacao_pendente = True
+            QTimer.singleShot(0, aplicar_formatacao)
         
+        campo._formatacao_pendente = False
         campo.textChanged.connect(formatar_texto)
\ No newline at end of file